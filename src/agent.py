@@ -1,6 +1,10 @@
+import asyncio
+import importlib
 import logging
+import re
+from types import ModuleType
+from typing import Optional
 
-from dotenv import load_dotenv
 from livekit.agents import (
     NOT_GIVEN,
     Agent,
@@ -14,32 +18,102 @@ from livekit.agents import (
     WorkerOptions,
     cli,
     metrics,
+    tokenize,
+    tts,
 )
 from livekit.agents.llm import function_tool
-from livekit.plugins import cartesia, deepgram, noise_cancellation, google, silero
+from livekit.plugins import deepgram, google, noise_cancellation, silero
 from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
+from agent_config import CONFIG
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger("agent")
 
-import os
-load_dotenv(".env")
+# Job subprocesses import this script as __mp_main__; a plain import (e.g. from the tests)
+# leaves the global event loop policy alone
+if uvloop is not None and __name__ in ("__main__", "__mp_main__"):
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# Cartesia starts synthesizing as soon as the tokenizer emits a chunk, so flush on clause
+# punctuation as well as sentence ends instead of waiting for the whole sentence.
+# This replaces the plugin's default sentence tokenizer, so periods after common
+# abbreviations are not treated as boundaries. Any other abbreviation still splits,
+# which only costs a slightly earlier flush.
+_MIN_CLAUSE_WORDS = 4
+_MAX_CLAUSE_WORDS = 80
+_CJK_CLAUSE_ENDS = "。．！？，、；："  # noqa: RUF001
+_CLAUSE_ENDS = ".!?,;:" + _CJK_CLAUSE_ENDS
+_OPENERS = "\"'([“‘「『（"  # noqa: RUF001
+_CLOSERS = "\"')]”’」』）"  # noqa: RUF001
+# Chinese and Japanese text has no spaces, so CJK punctuation also ends a word and
+# every CJK character counts as a word
+_WORD_RE = re.compile(
+    rf"[^\s{re.escape(_CJK_CLAUSE_ENDS)}]+"
+    rf"[{re.escape(_CJK_CLAUSE_ENDS)}]*[{re.escape(_CLOSERS)}]*"
+    rf"|[{re.escape(_CJK_CLAUSE_ENDS)}]+[{re.escape(_CLOSERS)}]*"
+)
+_CJK_CHAR_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]")
+_ABBREVIATIONS = frozenset(
+    {"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "jr.", "sr.", "vs.", "e.g.", "i.e."}
+)
+
+
+def _ends_clause(word: str) -> bool:
+    word = word.rstrip(_CLOSERS)
+    if not word or word[-1] not in _CLAUSE_ENDS:
+        return False
+    return word[-1] != "." or word.lstrip(_OPENERS).lower() not in _ABBREVIATIONS
+
 
-# --- DEBUGGING BLOCK ---
-print("--- Loading LiveKit credentials from .env ---")
-print(f"LIVEKIT_URL: {os.environ.get('LIVEKIT_URL')}")
-print(f"LIVEKIT_API_KEY: {os.environ.get('LIVEKIT_API_KEY')}")
-print(f"LIVEKIT_API_SECRET: {'SET' if os.environ.get('LIVEKIT_API_SECRET') else 'NOT SET'}")
-print("-----------------------------------------")
+def _split_clauses(text: str) -> list[tuple[str, int, int]]:
+    clauses = []
+    start = None
+    words = 0
+    for m in _WORD_RE.finditer(text):
+        if start is None:
+            start = m.start()
+        words += len(_CJK_CHAR_RE.findall(m.group())) or 1
+        if words >= _MAX_CLAUSE_WORDS or (
+            words >= _MIN_CLAUSE_WORDS and _ends_clause(m.group())
+        ):
+            clauses.append((text[start : m.end()], start, m.end()))
+            start = None
+            words = 0
 
+    if start is not None:
+        clauses.append((text[start:], start, len(text)))
+
+    return clauses
+
+
+class ClauseTokenizer(tokenize.SentenceTokenizer):
+    def tokenize(self, text: str, *, language: Optional[str] = None) -> list[str]:
+        return [clause for clause, _, _ in _split_clauses(text)]
+
+    def stream(self, *, language: Optional[str] = None) -> tokenize.SentenceStream:
+        return tokenize.BufferedSentenceStream(
+            tokenizer=_split_clauses,
+            min_token_len=1,
+            min_ctx_len=10,
+        )
+
+
+_ASSISTANT_INSTRUCTIONS = """You are a helpful voice AI assistant.
+            You eagerly assist users with their questions by providing information from your extensive knowledge.
+            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
+            You are curious, friendly, and have a sense of humor."""
 
 
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(
-            instructions="""You are a helpful voice AI assistant.
-            You eagerly assist users with their questions by providing information from your extensive knowledge.
-            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
-            You are curious, friendly, and have a sense of humor.""",
+            instructions=_ASSISTANT_INSTRUCTIONS,
         )
 
     # all functions annotated with @function_tool will be passed to the LLM when this
@@ -54,12 +128,67 @@ class Assistant(Agent):
             location: The location to look up weather information for (e.g. city name)
         """
 
-        logger.info(f"Looking up weather for {location}")
+        logger.info("Looking up weather for %s", location)
 
         return "sunny with a temperature of 70 degrees."
 
 
+def _base_url_opts(env_var: str) -> dict[str, str]:
+    # Lets a deployment pin a plugin to its closest regional endpoint, keeping the plugin's
+    # default when the variable is unset
+    base_url = CONFIG[env_var]
+    return {"base_url": base_url} if base_url else {}
+
+
+def _cartesia_tts(plugin: ModuleType) -> tts.TTS:
+    return plugin.TTS(
+        voice="6f84f4b8-58a2-430c-8c79-688dad597532",
+        tokenizer=ClauseTokenizer(),
+        **_base_url_opts("CARTESIA_BASE_URL"),
+    )
+
+
+def _elevenlabs_tts(plugin: ModuleType) -> tts.TTS:
+    # ElevenLabs streams word by word and chunks server side, so ClauseTokenizer is not used
+    return plugin.TTS()
+
+
+_TTS_FACTORIES = {
+    "cartesia": _cartesia_tts,
+    "elevenlabs": _elevenlabs_tts,
+}
+
+if CONFIG["TTS_BACKEND"] not in _TTS_FACTORIES:
+    raise ValueError(
+        f"unsupported TTS_BACKEND {CONFIG['TTS_BACKEND']!r}, "
+        f"expected one of {sorted(_TTS_FACTORIES)}"
+    )
+
+# Only the selected TTS plugin is imported. This stays at module level, plugins have to
+# register themselves on the main thread.
+_tts_plugin = importlib.import_module(f"livekit.plugins.{CONFIG['TTS_BACKEND']}")
+
+
 def prewarm(proc: JobProcess):
+    # Build the pipeline components while the process is idle, so a new job only has
+    # to compose them into an AgentSession. Each job process runs a single job, so these
+    # instances are never shared between sessions.
+    # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
+    # See all providers at https://docs.livekit.io/agents/integrations/llm/
+    proc.userdata["llm"] = google.LLM(model="gemini-2.5-flash")
+    # Speech-to-text (STT) is your agent's ears, turning the user's speech into text that the LLM can understand
+    # See all providers at https://docs.livekit.io/agents/integrations/stt/
+    proc.userdata["stt"] = deepgram.STT(
+        model="nova-3",
+        language="multi",
+        **_base_url_opts("DEEPGRAM_BASE_URL"),
+    )
+    # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
+    # See all providers at https://docs.livekit.io/agents/integrations/tts/
+    # The backend is picked with the TTS_BACKEND environment variable (cartesia or elevenlabs)
+    proc.userdata["tts"] = _TTS_FACTORIES[CONFIG["TTS_BACKEND"]](_tts_plugin)
+    # VAD and turn detection are used to determine when the user is speaking and when the agent should respond
+    # See more at https://docs.livekit.io/agents/build/turns
     proc.userdata["vad"] = silero.VAD.load()
 
 
@@ -71,18 +200,12 @@ async def entrypoint(ctx: JobContext):
     }
 
     # Set up a voice AI pipeline using OpenAI, Cartesia, Deepgram, and the LiveKit turn detector
+    # The LLM, STT, TTS and VAD are created in prewarm(). The turn detector has to be
+    # created here, its constructor looks up the job context's inference executor.
     session = AgentSession(
-        # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
-        # See all providers at https://docs.livekit.io/agents/integrations/llm/
-        llm=google.LLM(model="gemini-2.5-flash"),
-        # Speech-to-text (STT) is your agent's ears, turning the user's speech into text that the LLM can understand
-        # See all providers at https://docs.livekit.io/agents/integrations/stt/
-        stt=deepgram.STT(model="nova-3", language="multi"),
-        # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
-        # See all providers at https://docs.livekit.io/agents/integrations/tts/
-        tts=cartesia.TTS(voice="6f84f4b8-58a2-430c-8c79-688dad597532"),
-        # VAD and turn detection are used to determine when the user is speaking and when the agent should respond
-        # See more at https://docs.livekit.io/agents/build/turns
+        llm=ctx.proc.userdata["llm"],
+        stt=ctx.proc.userdata["stt"],
+        tts=ctx.proc.userdata["tts"],
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
         # allow the LLM to generate a response while waiting for the end of turn
@@ -114,7 +237,7 @@ async def entrypoint(ctx: JobContext):
 
     async def log_usage():
         summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 
@@ -142,5 +265,16 @@ async def entrypoint(ctx: JobContext):
     await ctx.connect()
 
 
+def _dump_creds():
+    print("--- Loading LiveKit credentials from .env ---")
+    print(f"LIVEKIT_URL: {CONFIG['LIVEKIT_URL']}")
+    print(f"LIVEKIT_API_KEY: {CONFIG['LIVEKIT_API_KEY']}")
+    print(f"LIVEKIT_API_SECRET: {'SET' if CONFIG['LIVEKIT_API_SECRET'] else 'NOT SET'}")
+    print("-----------------------------------------")
+
+
 if __name__ == "__main__":
+    # Only the main worker process runs this block, job subprocesses just import the module
+    if CONFIG["DEBUG_CREDS"]:
+        _dump_creds()
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -0,0 +1,21 @@
+import os
+from types import MappingProxyType
+
+from dotenv import load_dotenv
+
+# Read .env once per process. The plugins still pick their API keys up from os.environ,
+# everything the agent itself needs is snapshotted into a read-only mapping.
+load_dotenv(".env")
+
+CONFIG = MappingProxyType(
+    {
+        "LIVEKIT_URL": os.environ.get("LIVEKIT_URL"),
+        "LIVEKIT_API_KEY": os.environ.get("LIVEKIT_API_KEY"),
+        "LIVEKIT_API_SECRET": os.environ.get("LIVEKIT_API_SECRET"),
+        "DEEPGRAM_BASE_URL": os.environ.get("DEEPGRAM_BASE_URL"),
+        "CARTESIA_BASE_URL": os.environ.get("CARTESIA_BASE_URL"),
+        "TTS_BACKEND": os.environ.get("TTS_BACKEND", "cartesia"),
+        "DEBUG_CREDS": os.environ.get("DEBUG_CREDS", "").lower()
+        in {"1", "true", "yes"},
+    }
+)
@@ -3,7 +3,7 @@ from livekit.agents import AgentSession, llm
 from livekit.agents.voice.run_result import mock_tools
 from livekit.plugins import openai
 
-from agent import Assistant
+from agent import Assistant, ClauseTokenizer, _split_clauses
 
 
 def _llm() -> llm.LLM:
@@ -222,3 +222,109 @@ async def test_refuses_harmful_request() -> None:
 
         # Ensures there are no function calls or other unexpected events
         result.expect.no_more_events()
+
+
+def test_split_clauses_on_punctuation() -> None:
+    """Unit test for clause splitting on sentence and clause punctuation."""
+    text = "Sure, I can help you. Tokyo is sunny today; highs near seventy: pleasant! Want more details? Okay"
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        "Sure, I can help you.",
+        "Tokyo is sunny today;",
+        "highs near seventy: pleasant!",
+        "Want more details? Okay",
+    ]
+
+
+def test_split_clauses_waits_for_min_words() -> None:
+    """Punctuation before the fourth buffered word does not end a clause."""
+    assert [
+        clause for clause, _, _ in _split_clauses("Yes, sure. That works, thanks.")
+    ] == [
+        "Yes, sure. That works,",
+        "thanks.",
+    ]
+
+
+def test_split_clauses_forces_split_at_max_words() -> None:
+    """A run with no punctuation is split every 80 words."""
+    text = " ".join(f"w{i}" for i in range(170))
+    clauses = [clause for clause, _, _ in _split_clauses(text)]
+    assert [len(clause.split()) for clause in clauses] == [80, 80, 10]
+
+
+def test_split_clauses_keeps_trailing_text() -> None:
+    """Trailing text without punctuation is returned as the last clause."""
+    assert [clause for clause, _, _ in _split_clauses("hello there my friend")] == [
+        "hello there my friend"
+    ]
+
+
+def test_split_clauses_empty_input() -> None:
+    """Empty or whitespace-only text produces no clauses."""
+    assert _split_clauses("") == []
+    assert _split_clauses("   ") == []
+    assert ClauseTokenizer().tokenize("") == []
+
+
+def test_split_clauses_skips_abbreviations() -> None:
+    """Common abbreviations do not end a clause."""
+    text = "I went to see Dr. Smith and Mrs. Jones today. Then I left"
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        "I went to see Dr. Smith and Mrs. Jones today.",
+        "Then I left",
+    ]
+
+
+def test_split_clauses_single_capital_ends_sentence() -> None:
+    """A sentence-final single capital letter is not mistaken for an initial."""
+    text = "You should pick option A. It is the cheapest"
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        "You should pick option A.",
+        "It is the cheapest",
+    ]
+
+
+def test_split_clauses_closing_quotes_and_brackets() -> None:
+    """Closing quotes and brackets after a terminator still end a clause."""
+    text = 'He said "we are done." Then we left (it was over here.) Bye'
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        'He said "we are done."',
+        "Then we left (it was over here.)",
+        "Bye",
+    ]
+
+
+def test_split_clauses_cjk() -> None:
+    """Full-width punctuation splits text written without spaces."""
+    text = "好的，我来帮你查一下。东京今天是晴天，气温二十一度。"  # noqa: RUF001
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        "好的，我来帮你查一下。",  # noqa: RUF001
+        "东京今天是晴天，",  # noqa: RUF001
+        "气温二十一度。",
+    ]
+
+
+def test_split_clauses_full_width_closers() -> None:
+    """Japanese closing brackets after a full-width terminator end a clause."""
+    text = "彼は「わかりました。」と言いました！それでは"  # noqa: RUF001
+    assert [clause for clause, _, _ in _split_clauses(text)] == [
+        "彼は「わかりました。」",
+        "と言いました！",  # noqa: RUF001
+        "それでは",
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "  Sure, I can help you.   Tokyo is sunny today,\nwith a light breeze ",
+        "好的，我来帮你查一下。 东京今天是晴天，气温二十一度",  # noqa: RUF001
+    ],
+)
+def test_split_clauses_offsets(text: str) -> None:
+    """The offsets slice each clause back out of the original text."""
+    clauses = _split_clauses(text)
+    assert len(clauses) == 3
+    for clause, start, end in clauses:
+        assert text[start:end] == clause
+    assert clauses[-1][2] == len(text)